@@ -1,3 +1,8 @@
+import pathlib
+import pickle
+import tempfile
+import time
+import uuid
 from typing import Any, Dict, List, Optional, Type
 
 import torch
@@ -7,6 +12,128 @@ from tqdm import tqdm
 
 from probnmn.config import Config
 
+# How long non-master ranks wait for the rank 0 eval-done sentinel before raising. Generous
+# enough for a full validation pass, but bounded so a crash on rank 0 surfaces as an error on
+# all ranks instead of an indefinite spin.
+_EVAL_DONE_WAIT_SECONDS: float = 3600.0
+
+
+def _broadcast_py_object(obj: Any, device: torch.device, src: int = 0) -> Any:
+    r"""
+    Broadcast a picklable python object from ``src`` rank to all ranks and return it. Uses
+    :func:`torch.distributed.broadcast_object_list` when available (torch >= 1.8), else pickles
+    the object into a byte tensor and broadcasts that.
+    """
+    if hasattr(torch.distributed, "broadcast_object_list"):
+        object_list = [obj]
+        torch.distributed.broadcast_object_list(object_list, src=src)
+        return object_list[0]
+
+    if torch.distributed.get_rank() == src:
+        buffer = torch.tensor(bytearray(pickle.dumps(obj)), dtype=torch.uint8, device=device)
+        buffer_numel = torch.tensor([buffer.numel()], dtype=torch.long, device=device)
+    else:
+        buffer_numel = torch.tensor([0], dtype=torch.long, device=device)
+
+    torch.distributed.broadcast(buffer_numel, src)
+    if torch.distributed.get_rank() != src:
+        buffer = torch.empty(int(buffer_numel.item()), dtype=torch.uint8, device=device)
+
+    torch.distributed.broadcast(buffer, src)
+    return pickle.loads(buffer.cpu().numpy().tobytes())
+
+
+class _CudaPrefetcher(object):
+    r"""
+    An iterator wrapper over a :class:`~torch.utils.data.DataLoader`, which copies the next batch
+    to GPU on a side CUDA stream while the current batch is being consumed on the main stream.
+    This keeps the evaluation loop compute-bound instead of copy-bound, similar to NVIDIA APEX
+    ``data_prefetcher``.
+
+    Parameters
+    ----------
+    dataloader: torch.utils.data.DataLoader
+        A :class:`~torch.utils.data.DataLoader` which provides batches of examples. Construct it
+        with ``pin_memory=True`` so copies issued here are truly asynchronous.
+    device: torch.device
+        A CUDA device to copy batches to.
+    """
+
+    def __init__(self, dataloader: DataLoader, device: torch.device):
+        self._dataloader = dataloader
+        self._device = device
+        # The side stream must live on the target device - a bare Stream() lands on the current
+        # device, and with gpu_ids[0] != 0 the copies and stream fencing would silently run on
+        # different devices, serializing the prefetch.
+        self.stream = torch.cuda.Stream(device=device)
+
+        # Two persistent sets of device buffers (one per in-flight batch), allocated lazily from
+        # the first batches and reused afterwards. Validation batch shapes are fixed, so reusing
+        # buffers eliminates `cudaMalloc` calls and allocator fragmentation mid-loop.
+        self._buffers: List[Dict[str, torch.Tensor]] = [{}, {}]
+        self._slot = 0
+
+    def __len__(self):
+        return len(self._dataloader)
+
+    def __iter__(self):
+        self._iterator = iter(self._dataloader)
+        self._preload()
+        return self
+
+    def __next__(self) -> Dict[str, Any]:
+        if self._next_batch is None:
+            raise StopIteration
+
+        # Make sure the copy of this batch (issued on side stream) has finished.
+        torch.cuda.current_stream(self._device).wait_stream(self.stream)
+        batch = self._next_batch
+
+        # Record batch tensors on main stream, so their memory is not reclaimed by the caching
+        # allocator while main stream still works on them.
+        for key in batch:
+            if isinstance(batch[key], torch.Tensor):
+                batch[key].record_stream(torch.cuda.current_stream(self._device))
+
+        # Kick off the copy of next batch before returning this one.
+        self._preload()
+        return batch
+
+    def _preload(self):
+        r"""Fetch the next batch from dataloader and start copying it on the side stream."""
+        try:
+            batch = next(self._iterator)
+        except StopIteration:
+            self._next_batch = None
+            return
+
+        with torch.cuda.stream(self.stream):
+            # Overwriting persistent buffers must wait until work already enqueued on the main
+            # stream (which may still read the batch that last occupied this slot) finishes.
+            self.stream.wait_stream(torch.cuda.current_stream(self._device))
+
+            buffers = self._buffers[self._slot]
+            self._slot = 1 - self._slot
+
+            # Build a fresh dict instead of mutating the dataloader's in place - a right-sized
+            # dict without rehashing churn, and the host batch is dropped as soon as its tensors
+            # are copied, so pinned memory returns to the dataloader earlier.
+            device_batch: Dict[str, Any] = {}
+            for key, value in batch.items():
+                if not isinstance(value, torch.Tensor):
+                    device_batch[key] = value
+                    continue
+
+                buffer = buffers.get(key)
+                if buffer is None or buffer.shape != value.shape or buffer.dtype != value.dtype:
+                    # Allocate on the first batch, or on an odd-sized tail batch.
+                    buffers[key] = buffer = torch.empty_like(value, device=self._device)
+
+                buffer.copy_(value, non_blocking=True)
+                device_batch[key] = buffer
+
+            self._next_batch = device_batch
+
 
 class _Evaluator(object):
     r"""
@@ -60,6 +187,15 @@ class _Evaluator(object):
         # models will already be on apropriate device already, if passed from trainer.
         self._device = torch.device(f"cuda:{gpu_ids[0]}" if gpu_ids[0] >= 0 else "cpu")
 
+        # Monotonic count of :meth:`evaluate` calls. In distributed training, evaluate is
+        # invoked in lockstep on all ranks, so this counter is identical across ranks and makes
+        # the eval-done sentinel filename unique per call.
+        self._num_eval_calls = 0
+
+        # Random token shared by all ranks of this run, broadcast from rank 0 on first eval, so
+        # sentinels of crashed or concurrent runs on the same host are never mistaken for ours.
+        self._run_token: Optional[str] = None
+
     @property
     def models(self):
         return self._models
@@ -80,37 +216,119 @@ class _Evaluator(object):
             Final evaluation metrics for all the models.
         """
 
-        # Switch all models to "eval" mode.
-        for model_name in self._models:
-            self._models[model_name].eval()
+        # Metrics here only need to be computed once, so in distributed training the eval loop
+        # runs fully on rank 0. Other ranks wait on a sentinel file instead of a collective,
+        # keeping their GPUs free and not holding a barrier open for the whole eval duration.
+        world_size = (
+            torch.distributed.get_world_size()
+            if torch.distributed.is_available() and torch.distributed.is_initialized()
+            else 1
+        )
+        is_master = world_size == 1 or torch.distributed.get_rank() == 0
 
-        with torch.no_grad():
-            for iteration, batch in enumerate(tqdm(self._dataloader, desc="validation")):
-                for key in batch:
-                    batch[key] = batch[key].to(self._device)
+        self._num_eval_calls += 1
+        if world_size > 1:
+            # One random token shared by all ranks of this run, agreed upon on first eval.
+            if self._run_token is None:
+                self._run_token = _broadcast_py_object(
+                    uuid.uuid4().hex if is_master else None, self._device
+                )
 
-                _ = self._do_iteration(batch)
-                if num_batches is not None and iteration > num_batches:
-                    break
+            # Sentinel written by rank 0 once evaluation finishes. The name is unique per run
+            # and per call, so a stale file left behind by a crashed run, a concurrent job on
+            # this host, or an earlier call can never release the wait below prematurely. The
+            # temp dir is node-local - this sync assumes all ranks share one node, multi-node
+            # jobs would need the sentinel on a shared filesystem instead.
+            done_sentinel = pathlib.Path(tempfile.gettempdir()) / (
+                f"probnmn_eval_done_{self._run_token}_{self._num_eval_calls}.txt"
+            )
 
         # keys: `self._models.keys()`
         eval_metrics: Dict[str, Dict[str, Any]] = {}
-        for model_name in self._models:
-
-            # Get metrics recorded by a particular model. This `hasattr` check exists because
-            # it is a generic base class, all the models in `probnmn.models` implement a
-            # `get_metrics` method.
-            if hasattr(self._models[model_name], "get_metrics"):
-                # keys: names of metrics recorded by corresponding model.
-                eval_metrics[model_name] = self._models[model_name].get_metrics()
-
-            elif isinstance(self._models[model_name], nn.DataParallel):
-                if hasattr(self._models[model_name].module, "get_metrics"):
-                    eval_metrics[model_name] = self._models[model_name].module.get_metrics()
-
-        # Switch all models back to "train" mode.
-        for model_name in self._models:
-            self._models[model_name].train()
+
+        if is_master:
+            # Record training mode of all models, and switch to "eval" mode only those which are
+            # in "train" mode. Skipping the no-op calls avoids a recursive walk over all
+            # sub-modules.
+            prev_modes = {
+                model_name: model.training for model_name, model in self._models.items()
+            }
+            for model_name in self._models:
+                if prev_modes[model_name]:
+                    self._models[model_name].eval()
+
+            # Prefetch batches to GPU on a side CUDA stream, copy of batch k + 1 overlaps
+            # forward pass of batch k. On CPU there are no transfers, iterate the dataloader
+            # directly.
+            if self._device.type == "cuda":
+                batch_iterator = _CudaPrefetcher(self._dataloader, self._device)
+            else:
+                batch_iterator = self._dataloader
+
+            # Prefer `torch.inference_mode` (torch >= 1.9) over `torch.no_grad` - it also
+            # disables view tracking and version counters, shaving per-op overhead in the
+            # forward pass.
+            inference_context = getattr(torch, "inference_mode", torch.no_grad)
+
+            # Throttle progress bar refreshes - per-iteration terminal flushes cost 1-2 ms each
+            # for fast forward passes, and redirected cluster logs should not accumulate a bar
+            # frame per batch.
+            progress_bar = tqdm(
+                batch_iterator, desc="validation", mininterval=0.5, miniters=50
+            )
+
+            with inference_context():
+                for iteration, batch in enumerate(progress_bar):
+                    # Check the bound before doing a forward pass, else we would evaluate one
+                    # batch extra than requested.
+                    if num_batches is not None and iteration >= num_batches:
+                        break
+                    _ = self._do_iteration(batch)
+
+            for model_name in self._models:
+
+                # Get metrics recorded by a particular model. This `hasattr` check exists
+                # because it is a generic base class, all the models in `probnmn.models`
+                # implement a `get_metrics` method.
+                if hasattr(self._models[model_name], "get_metrics"):
+                    # keys: names of metrics recorded by corresponding model.
+                    eval_metrics[model_name] = self._models[model_name].get_metrics()
+
+                elif isinstance(self._models[model_name], nn.DataParallel):
+                    if hasattr(self._models[model_name].module, "get_metrics"):
+                        eval_metrics[model_name] = self._models[model_name].module.get_metrics()
+
+            # Switch back to "train" mode only those models which were in "train" mode earlier.
+            for model_name in self._models:
+                if prev_modes[model_name]:
+                    self._models[model_name].train()
+
+            # Signal other ranks that evaluation is done.
+            if world_size > 1:
+                done_sentinel.touch()
+        else:
+            # Wait for rank 0 to finish evaluation, bounded so a crash there does not leave
+            # this rank spinning forever with no error.
+            wait_deadline = time.monotonic() + _EVAL_DONE_WAIT_SECONDS
+            while not done_sentinel.exists():
+                if time.monotonic() > wait_deadline:
+                    raise RuntimeError(
+                        f"Rank {torch.distributed.get_rank()} timed out after "
+                        f"{_EVAL_DONE_WAIT_SECONDS} seconds waiting for the rank 0 eval-done "
+                        f"sentinel {done_sentinel} - did rank 0 crash during evaluation?"
+                    )
+                time.sleep(0.1)
+
+        if world_size > 1:
+            # Make sure all ranks return identical metrics.
+            eval_metrics = _broadcast_py_object(eval_metrics, self._device)
+
+            # Re-synchronize ranks once before returning to training, so stragglers do not
+            # stall the next collective op and time out NCCL. Every rank is past the sentinel
+            # wait here and the filename is never reused, so removal is pure cleanup.
+            torch.distributed.barrier()
+            if is_master:
+                done_sentinel.unlink()
 
         return eval_metrics
 
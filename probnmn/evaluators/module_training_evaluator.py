@@ -63,7 +63,10 @@ class ModuleTrainingEvaluator(_Evaluator):
             self._C.DATA.VAL_TOKENS, self._C.DATA.VAL_FEATURES, in_memory=False
         )
         dataloader = DataLoader(
-            dataset, batch_size=self._C.OPTIM.BATCH_SIZE, num_workers=cpu_workers
+            dataset,
+            batch_size=self._C.OPTIM.BATCH_SIZE,
+            num_workers=cpu_workers,
+            pin_memory=gpu_ids[0] >= 0,
         )
 
         super().__init__(config=config, dataloader=dataloader, models=models, gpu_ids=gpu_ids)
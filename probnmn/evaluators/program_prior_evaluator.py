@@ -58,7 +58,9 @@ class ProgramPriorEvaluator(_Evaluator):
         self._vocabulary = Vocabulary.from_files(self._C.DATA.VOCABULARY)
 
         dataset = ProgramPriorDataset(self._C.DATA.VAL_TOKENS)
-        dataloader = DataLoader(dataset, batch_size=self._C.OPTIM.BATCH_SIZE)
+        dataloader = DataLoader(
+            dataset, batch_size=self._C.OPTIM.BATCH_SIZE, pin_memory=gpu_ids[0] >= 0
+        )
 
         super().__init__(config=config, dataloader=dataloader, models=models, gpu_ids=gpu_ids)
 
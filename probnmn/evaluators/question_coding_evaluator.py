@@ -60,7 +60,10 @@ class QuestionCodingEvaluator(_Evaluator):
         # There is no notion of "supervision" during evaluation.
         dataset = QuestionCodingDataset(self._C.DATA.VAL_TOKENS)
         dataloader = DataLoader(
-            dataset, batch_size=self._C.OPTIM.BATCH_SIZE, num_workers=cpu_workers
+            dataset,
+            batch_size=self._C.OPTIM.BATCH_SIZE,
+            num_workers=cpu_workers,
+            pin_memory=gpu_ids[0] >= 0,
         )
 
         super().__init__(config=config, dataloader=dataloader, models=models, gpu_ids=gpu_ids)
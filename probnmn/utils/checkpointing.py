@@ -1,6 +1,9 @@
 import copy
+import json
 import os
 import pathlib
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union, Type
 
 from loguru import logger
@@ -8,6 +11,87 @@ import torch
 from torch import nn, optim
 
 
+def _is_master_rank() -> bool:
+    r"""Whether this process is rank 0 - trivially true outside distributed training."""
+    if torch.distributed.is_available() and torch.distributed.is_initialized():
+        return torch.distributed.get_rank() == 0
+    return True
+
+
+def _to_cpu(state_dict: Any) -> Any:
+    r"""
+    Recursively copy all tensors in a (possibly nested) state dict to CPU, rebuilding all
+    containers along the way - ``Optimizer.state_dict()`` exposes the optimizer's live inner
+    dicts, so writing into them would corrupt its state. Copies are issued non-blocking so all
+    device-to-host transfers overlap, callers should synchronize once afterwards.
+    """
+    if isinstance(state_dict, torch.Tensor):
+        # For CPU-resident tensors `.to("cpu")` returns an alias, not a copy - force a real
+        # copy so the snapshot never shares storage with live training tensors.
+        if state_dict.is_cuda:
+            return state_dict.detach().to("cpu", non_blocking=True)
+        return state_dict.detach().clone()
+    elif isinstance(state_dict, dict):
+        return {key: _to_cpu(value) for key, value in state_dict.items()}
+    elif isinstance(state_dict, list):
+        return [_to_cpu(value) for value in state_dict]
+
+    return state_dict
+
+
+def _split_tensors(obj: Any, tensors: Optional[Dict[str, torch.Tensor]] = None) -> Any:
+    r"""
+    Recursively split a (possibly nested) state dict into a JSON-encodable skeleton and a flat
+    dict of tensors, replacing each tensor with a small placeholder marker. Optimizer state
+    dicts carry thousands of tiny python ints/floats which pickle slowly - routing them through
+    :mod:`json` instead skips pickle's per-object memoization overhead. Dicts and tuples are
+    encoded with markers too, as JSON would silently turn int keys into strings and tuples into
+    lists. Raises ``TypeError`` for values neither JSON nor tensor, callers should fall back to
+    plain pickling then.
+    """
+    if tensors is None:
+        tensors = {}
+
+    if isinstance(obj, torch.Tensor):
+        marker = str(len(tensors))
+        tensors[marker] = obj
+        return {"__tensor__": marker}, tensors
+    elif isinstance(obj, dict):
+        encoded = {
+            "__dict__": [
+                [_split_tensors(key, tensors)[0], _split_tensors(value, tensors)[0]]
+                for key, value in obj.items()
+            ]
+        }
+        return encoded, tensors
+    elif isinstance(obj, tuple):
+        return {"__tuple__": [_split_tensors(value, tensors)[0] for value in obj]}, tensors
+    elif isinstance(obj, list):
+        return [_split_tensors(value, tensors)[0] for value in obj], tensors
+    elif obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj, tensors
+
+    raise TypeError(f"Cannot JSON-encode object of type {type(obj)}.")
+
+
+def _merge_tensors(encoded: Any, tensors: Dict[str, torch.Tensor]) -> Any:
+    r"""Reverse :func:`_split_tensors` - substitute tensors back into the decoded skeleton."""
+    if isinstance(encoded, dict):
+        if "__tensor__" in encoded:
+            return tensors[encoded["__tensor__"]]
+        elif "__tuple__" in encoded:
+            return tuple(_merge_tensors(value, tensors) for value in encoded["__tuple__"])
+        elif "__dict__" in encoded:
+            return {
+                _merge_tensors(key, tensors): _merge_tensors(value, tensors)
+                for key, value in encoded["__dict__"]
+            }
+    elif isinstance(encoded, list):
+        return [_merge_tensors(value, tensors) for value in encoded]
+
+    return encoded
+
+
 class CheckpointManager(object):
     r"""
     A :class:`CheckpointManager` periodically serializes models and other checkpointable objects
@@ -55,52 +139,121 @@ class CheckpointManager(object):
         self.serialization_dir = pathlib.Path(serialization_dir)
         self.keep_recent = keep_recent
 
+        # Cached filename format, avoids constructing path objects on every save/delete.
+        self._ckpt_fmt = str(self.serialization_dir / "checkpoint_{}.pth")
+
         # Shallow copy, keeps references to tensors as original objects.
         self.checkpointables = copy.copy(checkpointables)
 
-        # Initialize members to hold state dict of best checkpoint and its performance.
+        # Wrapping in DataParallel/DistributedDataParallel is fixed at construction, cache the
+        # unwrapped objects once instead of isinstance-checking per key on every step.
+        self._unwrap = {
+            key: value.module
+            if isinstance(value, (nn.DataParallel, nn.parallel.DistributedDataParallel))
+            else value
+            for key, value in self.checkpointables.items()
+        }
+
+        # Initialize members to hold iteration of best checkpoint and its performance.
         self._best_metric: float = -1e-12
-        self._best_ckpt: Dict[str, Any] = {}
+        self._best_iteration: int = -1
 
         # Keep epoch/iteration numbers of recently saved 'k' checkpoints.
         self._recent_iterations: List[int] = []
 
+        # Single background thread for writing checkpoints to disk, so training does not block
+        # on disk I/O. At most one write is pending at any time.
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._last_write: Optional[Future] = None
+
     def step(self, iteration: int, metric: Optional[float] = None):
         r"""Serialize checkpoint and update best checkpoint based on metric."""
 
+        # In distributed training, all ranks hold identical checkpointable states - only the
+        # master process writes to disk, else we get N identical files and N-fold disk traffic.
+        if not _is_master_rank():
+            return
+
+        # Wait for the previous write (if still pending) - this bounds pending writes to one
+        # and propagates any I/O errors from the background thread.
+        if self._last_write is not None:
+            self._last_write.result()
+            self._last_write = None
+
+        # Update the best checkpoint based on metric, if provided. Decide this before touching
+        # any state dicts - materializing them walks every module and should happen exactly
+        # once, right before the write that needs it.
+        best_updated = False
+        if metric is not None and metric > self._best_metric:
+            self._best_metric = metric
+            self._best_iteration = iteration
+            best_updated = True
+
         checkpointable_state_dict: Dict[str, Any] = self._state_dict()
 
         # We also checkpoint current iteration.
         checkpointable_state_dict["iteration"] = iteration
 
-        # Update the best checkpoint based on metric, if provided.
-        if metric is not None and metric > self._best_metric:
-            self._best_metric = metric
-            self._best_ckpt = copy.copy(checkpointable_state_dict)
-
-        # Serialize checkpoint corresponding to current iteration.
-        torch.save(
-            checkpointable_state_dict, self.serialization_dir / f"checkpoint_{iteration}.pth"
+        # Serialize checkpoint in the background - state dict is already snapshotted to CPU, so
+        # the worker only pickles and writes while the next training iteration proceeds.
+        checkpoint_path = pathlib.Path(self._ckpt_fmt.format(iteration))
+        self._last_write = self._io_pool.submit(
+            self._write_checkpoint, checkpointable_state_dict, checkpoint_path, best_updated
         )
-        # Serialize best performing checkpoint observed so far.
-        torch.save(self._best_ckpt, self.serialization_dir / "checkpoint_best.pth")
 
         # Remove earliest checkpoint if there are more on disk.
         self._recent_iterations.append(iteration)
         if len(self._recent_iterations) > self.keep_recent:
             self.remove_earliest_checkpoint()
 
+    def _write_checkpoint(
+        self, checkpointable_state_dict: Dict[str, Any], checkpoint_path: pathlib.Path,
+        best_updated: bool,
+    ):
+        r"""Write one checkpoint to disk, runs on the background I/O thread."""
+
+        # Separate tensors from python metadata, pickling only tensors plus one JSON string.
+        # Fall back to pickling everything if some checkpointable holds non-JSON values.
+        try:
+            encoded, tensors = _split_tensors(checkpointable_state_dict)
+            payload: Dict[str, Any] = {"__meta__": json.dumps(encoded), "__tensors__": tensors}
+        except (TypeError, ValueError):
+            payload = checkpointable_state_dict
+
+        # Protocol 4 pickles faster than the default protocol 2, and the zipfile format writes
+        # tensor storages in one pass instead of the legacy tar format's double copy.
+        torch.save(
+            payload, checkpoint_path, pickle_protocol=4, _use_new_zipfile_serialization=True
+        )
+
+        # Update best performing checkpoint, only when it changed this step. Copy the file just
+        # serialized instead of serializing a second time, with an atomic rename so a crash
+        # mid-copy never leaves a truncated ``checkpoint_best.pth`` behind.
+        if best_updated:
+            best_path = self.serialization_dir / "checkpoint_best.pth"
+            shutil.copyfile(checkpoint_path, str(best_path) + ".tmp")
+            os.replace(str(best_path) + ".tmp", best_path)
+
+    def close(self):
+        r"""Block until the pending checkpoint write (if any) finishes."""
+        self._io_pool.shutdown(wait=True)
+
+    def __del__(self):
+        if getattr(self, "_io_pool", None) is not None:
+            self.close()
+
     def _state_dict(self):
         r"""Return a dict containing state dict of all checkpointables."""
 
-        checkpointable_state_dict: Dict[str, Any] = {}
-        for key in self.checkpointables:
-            if isinstance(self.checkpointables[key], nn.DataParallel) or isinstance(
-                self.checkpointables[key], nn.parallel.DistributedDataParallel
-            ):
-                checkpointable_state_dict[key] = self.checkpointables[key].module.state_dict()
-            else:
-                checkpointable_state_dict[key] = self.checkpointables[key].state_dict()
+        checkpointable_state_dict: Dict[str, Any] = {
+            key: checkpointable.state_dict() for key, checkpointable in self._unwrap.items()
+        }
+
+        # Stage everything to CPU upfront with overlapping non-blocking copies, so `torch.save`
+        # has no device work left to do (it would otherwise copy tensors out one by one).
+        checkpointable_state_dict = _to_cpu(checkpointable_state_dict)
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
 
         return checkpointable_state_dict
 
@@ -108,7 +261,7 @@ class CheckpointManager(object):
         r"""Remove ealiest serialized checkpoint from disk."""
 
         earliest_iteration = self._recent_iterations.pop(0)
-        (self._serialization_dir / f"checkpoint_{earliest_iteration}.pth").unlink()
+        pathlib.Path(self._ckpt_fmt.format(earliest_iteration)).unlink()
 
     def load(self, checkpoint_path: str):
         r"""
@@ -128,8 +281,21 @@ class CheckpointManager(object):
             This will be -1 in case of best checkpoint, or if info does not exist.
         """
 
-        logger.info(f"Loading checkpoint from {checkpoint_path}")
+        # All ranks load the checkpoint (each needs the weights), but only the master rank
+        # logs, to avoid N-fold log spam in distributed training.
+        is_master = _is_master_rank()
+
+        if is_master:
+            logger.info(f"Loading checkpoint from {checkpoint_path}")
         checkpoint = torch.load(checkpoint_path, map_location="cpu")
+
+        # Checkpoints serialized by :meth:`step` keep tensors and JSON-encoded python metadata
+        # separately, merge them back. Checkpoints from older code load as plain dicts.
+        if "__meta__" in checkpoint and "__tensors__" in checkpoint:
+            checkpoint = _merge_tensors(
+                json.loads(checkpoint["__meta__"]), checkpoint["__tensors__"]
+            )
+
         iteration = checkpoint.pop("iteration", -1)
 
         # Keep flags of all checkpointables to lo which ones were not loaded.
@@ -138,20 +304,17 @@ class CheckpointManager(object):
         # Load each checkpointable from checkpoint.
         for key in checkpoint:
             if key in self.checkpointables:
-                logger.info(f"Loading {key} from {checkpoint_path}")
+                if is_master:
+                    logger.info(f"Loading {key} from {checkpoint_path}")
 
-                # Handle case of DataParallel and DistributedDataParallel.
-                if isinstance(self.checkpointables[key], nn.DataParallel) or isinstance(
-                    self.checkpointables[key], nn.parallel.DistributedDataParallel
-                ):
-                    self.checkpointables[key].module.load_state_dict(checkpoint[key])
-                else:
-                    self.checkpointables[key].load_state_dict(checkpoint[key])
+                # `_unwrap` handles the case of DataParallel and DistributedDataParallel.
+                self._unwrap[key].load_state_dict(checkpoint[key])
 
                 is_loaded[key] = True
-            else:
+            elif is_master:
                 logger.info(f"{key} not found in `checkpointables`.")
 
         not_loaded: List[str] = [key for key in is_loaded if not is_loaded[key]]
-        logger.info(f"Checkpointables not found in file: {not_loaded}")
+        if is_master:
+            logger.info(f"Checkpointables not found in file: {not_loaded}")
         return iteration